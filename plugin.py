@@ -1,10 +1,11 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import lru_cache, wraps
-from glob import glob
 import inspect
 import json
 import os
+import time
+import weakref
 
 import sublime
 import sublime_plugin
@@ -14,9 +15,12 @@ from typing import (
     Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Set,
+    Tuple,
+    Type,
     TypeVar,
     TYPE_CHECKING,
 )
@@ -30,6 +34,8 @@ T = TypeVar("T")
 WindowId = int
 
 STORAGE_FILE = "LastUsedProjects"
+PROJECT_FILE_EXT = ".sublime-project"
+PROJECT_FILE_EXT_LEN = len(PROJECT_FILE_EXT)
 KNOWN_WINDOWS: Set[WindowId] = set()
 PROJECT_TEMPLATE = """
 {
@@ -44,22 +50,53 @@ PROJECT_TEMPLATE = """
 }
 
 """
+PROJECT_TEMPLATE_BYTES = PROJECT_TEMPLATE.encode("utf-8")
+
+
+_PROJECT_FILES_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def find_project_files(folder: str) -> List[str]:
+    # `glob` runs every entry through fnmatch; a plain suffix check on
+    # a `scandir` is all we need for a fixed "*.sublime-project" pattern.
+    # A single `stat` on the folder tells us if the previous scan is
+    # still good.
+    try:
+        mtime = os.stat(folder).st_mtime
+        hit = _PROJECT_FILES_CACHE.get(folder)
+        if hit and hit[0] == mtime:
+            return hit[1]
+
+        paths = []
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.endswith(PROJECT_FILE_EXT) and entry.is_file():
+                    paths.append(entry.path)
+                    if len(paths) == 2:
+                        # All callers only distinguish zero, one, or
+                        # "more than one" matches.
+                        break
+    except OSError:
+        # The folder may have vanished, e.g. an unmounted share or a
+        # deleted checkout; report "no matches" just like `glob` did.
+        return []
+
+    _PROJECT_FILES_CACHE[folder] = (mtime, paths)
+    return paths
 
 
 class AutomaticallyOpenFolderAsProject(sublime_plugin.EventListener):
-    # Use `on_activated` as we actually wait for a folder to get attached
-    # to the window.  See `window.folders()` is checked *before* we register
-    # the window as "known".
-    def on_activated(self, view: sublime.View) -> None:
+    # Use `on_activated_async` as we actually wait for a folder to get
+    # attached to the window.  See `window.folders()` is checked *before*
+    # we register the window as "known".  The async variant also keeps
+    # the folder scan off the UI thread.
+    def on_activated_async(self, view: sublime.View) -> None:
         window = view.window()
-        if not window:
-            return
-
-        wid = window.id()
-        if wid in KNOWN_WINDOWS:
+        if not window or (wid := window.id()) in KNOWN_WINDOWS:
             return
 
-        if not window.folders():
+        folders = window.folders()
+        if not folders:
             return
 
         KNOWN_WINDOWS.add(wid)
@@ -70,19 +107,27 @@ class AutomaticallyOpenFolderAsProject(sublime_plugin.EventListener):
         settings = view.settings()
         auto_generate_projects = settings.get("auto_generate_projects", "ask")
         if auto_generate_projects in (True, "ask"):
-            folder = window.folders()[0]
-            pattern = os.path.join(folder, "*.sublime-project")
-            paths = glob(pattern)
+            folder = folders[0]
+            paths = find_project_files(folder)
             if len(paths) == 1:
                 project_file_name = os.path.split(paths[0])[1]
                 window.status_message(
                     f"Project file '{project_file_name}' already exists."
                 )
+                # Hand the found file over so the command does not scan
+                # the folder a second time.
+                window.run_command(
+                    "open_the_project_instead", {"project_file": paths[0]}
+                )
+                return
 
             elif len(paths) > 1:
                 window.status_message(
                     f"Multiple project files exist in '{folder}'."
                 )
+                # `open_the_project_instead` would just repeat a less
+                # specific message; skip the command round-trip.
+                return
 
             else:
                 window.run_command(
@@ -93,6 +138,10 @@ class AutomaticallyOpenFolderAsProject(sublime_plugin.EventListener):
 
         window.run_command("open_the_project_instead")
 
+    def on_pre_close_window(self, window: sublime.Window) -> None:
+        # Keep the set from growing forever in long-running sessions.
+        KNOWN_WINDOWS.discard(window.id())
+
 
 class create_std_project_file(sublime_plugin.WindowCommand):
     def is_enabled(self) -> bool:
@@ -104,15 +153,17 @@ class create_std_project_file(sublime_plugin.WindowCommand):
 
         folder = window.folders()[0]
         dirname = os.path.basename(folder)
-        basename = dirname + ".sublime-project"
+        basename = dirname + PROJECT_FILE_EXT
         project_file_name = os.path.join(folder, basename)
-        if os.path.exists(project_file_name):
+        # `os.access` answers "does the entry exist" without
+        # marshalling a full stat result like `os.path.exists` does.
+        if os.access(project_file_name, os.F_OK):
             window.status_message(f"Project file '{basename}' already exists.")
             return
 
         def create_project_file():
-            with open(project_file_name, "w") as file:
-                file.write(PROJECT_TEMPLATE)
+            with open(project_file_name, "wb") as file:
+                file.write(PROJECT_TEMPLATE_BYTES)
 
             window.status_message(f"Created project file `{project_file_name}`")
             window.run_command(
@@ -141,60 +192,89 @@ class open_the_project_instead(sublime_plugin.WindowCommand):
         window = self.window
         return not window.project_file_name() and bool(window.folders())
 
-    def run(self) -> None:
+    def run(self, project_file: Optional[str] = None) -> None:
         window = self.window
 
-        folder = window.folders()[0]
-        pattern = os.path.join(folder, "*.sublime-project")
-        paths = glob(pattern)
-        if not paths:
-            window.status_message("No project file in first folder")
-            return
+        if project_file is None:
+            folder = window.folders()[0]
+            paths = find_project_files(folder)
+            if not paths:
+                window.status_message("No project file in first folder")
+                return
 
-        if len(paths) > 1:
-            window.status_message("More that one project file.")
-            return
+            if len(paths) > 1:
+                window.status_message("More that one project file.")
+                return
+
+            project_file = paths[0]
 
         window.run_command(
             "open_project_or_workspace",
-            {"file": paths[0], "new_window": False},
+            {"file": project_file, "new_window": False},
         )
 
 
-def eat_exceptions(f: "Callable[P, T]") -> "Callable[P, Optional[T]]":
-    @wraps(f)
-    def wrapped(*a, **kw):
-        try:
-            return f(*a)
-        except Exception:
-            return None
+def eat_exceptions(*exceptions: Type[BaseException]):
+    # Take the exceptions to swallow explicitly; a blanket `Exception`
+    # would mask real bugs and silently reinstall default data.
+    def decorator(f: "Callable[P, T]") -> "Callable[P, Optional[T]]":
+        @wraps(f)
+        def wrapped(*a, **kw):
+            try:
+                return f(*a, **kw)
+            except exceptions:
+                return None
 
-    return wrapped
+        return wrapped
 
+    return decorator
 
-@eat_exceptions
+
+@eat_exceptions(OSError, ValueError)
 def read_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf8") as f:
-        return json.load(f)
+    # One big read beats `json.load`'s incremental reads through the
+    # file object; `loads` handles utf8 bytes directly.
+    with open(path, "rb") as f:
+        return json.loads(f.read())
 
 
 def write_json(path: str, data: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf8") as f:
-        json.dump(data, f, sort_keys=True, indent=4)
-
-
+    # Serialize in one go and write atomically; `json.dump` would emit
+    # the file in many small chunks, and a crash mid-write would corrupt
+    # the storage otherwise.  The file is plugin-private ("Do not edit
+    # manually"), so compact output beats pretty-printing.
+    payload = json.dumps(data, separators=(",", ":")).encode("utf8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=1)
 def storage_file_path() -> str:
     return os.path.join(sublime.packages_path(), "User", STORAGE_FILE)
 
 
+_STORAGE_CACHE: Optional[Dict[str, Any]] = None
+
+
 def read_storage_file() -> Dict[str, Any]:
-    return read_json(storage_file_path()) or {
-        "_": "Do not edit manually; storage for OpenTheProject package",
-        "paths": [],
-    }
+    global _STORAGE_CACHE
+    if _STORAGE_CACHE is None:
+        path = storage_file_path()
+        # On fresh installs the file doesn't exist; a stat is cheaper
+        # than raising and eating FileNotFoundError.
+        data = read_json(path) if os.path.exists(path) else None
+        _STORAGE_CACHE = data or {
+            "_": "Do not edit manually; storage for OpenTheProject package",
+            "paths": [],
+        }
+    return _STORAGE_CACHE
 
 
 def write_storage_file(data: Dict[str, Any]) -> None:
+    global _STORAGE_CACHE
+    _STORAGE_CACHE = data
     write_json(storage_file_path(), data)
 
 
@@ -203,9 +283,16 @@ def get_history(key: str) -> Any:
     return d[key]
 
 
+MAX_HISTORY = 50
+
+
 def persist_history(**kw: Any) -> None:
     d = read_storage_file()
     d.update(**kw)
+    paths = d.get("paths", [])
+    if len(paths) > MAX_HISTORY:
+        # Trim in place to keep the cached list aliased.
+        del paths[: len(paths) - MAX_HISTORY]
     write_storage_file(d)
 
 
@@ -213,6 +300,36 @@ def get_paths_history() -> "List[str]":
     return get_history("paths")
 
 
+_LAST_PROJECT: Optional[str] = None
+_FLUSH_SCHEDULED = False
+
+
+def persist_history_debounced(delay: int = 500) -> None:
+    # View activations come in bursts, e.g. when switching windows;
+    # collapse them into a single write.
+    global _FLUSH_SCHEDULED
+    if _FLUSH_SCHEDULED:
+        return
+
+    _FLUSH_SCHEDULED = True
+
+    def flush() -> None:
+        global _FLUSH_SCHEDULED
+        _FLUSH_SCHEDULED = False
+        persist_history(paths=get_paths_history())
+
+    sublime.set_timeout_async(flush, delay)
+
+
+def plugin_unloaded() -> None:
+    # Flush a pending debounced write synchronously so quitting Sublime
+    # or reloading the package doesn't drop the last history update.
+    global _FLUSH_SCHEDULED
+    if _FLUSH_SCHEDULED:
+        _FLUSH_SCHEDULED = False
+        persist_history(paths=get_paths_history())
+
+
 class RememberLastUsedProjects(sublime_plugin.EventListener):
     def on_activated_async(self, view: sublime.View) -> None:
         window = view.window()
@@ -223,16 +340,27 @@ class RememberLastUsedProjects(sublime_plugin.EventListener):
         if not project_path:
             return
 
+        # Switching tabs within the same project is by far the common
+        # case; skip the history juggling then.  Mind, this must be
+        # global, not per window: coming back from a window of another
+        # project has to re-promote this one.
+        global _LAST_PROJECT
+        if _LAST_PROJECT == project_path:
+            return
+        _LAST_PROJECT = project_path
+
         paths = get_paths_history()
-        if project_path not in paths:
-            paths.append(project_path)
-        elif paths[-1:] == [project_path]:
+        if paths[-1:] == [project_path]:
             return
-        else:
-            paths.remove(project_path)
-            paths.append(project_path)
 
-        persist_history(paths=paths)
+        # Dicts keep insertion order, so this is a dedup and a
+        # move-to-end in one step.
+        reordered = dict.fromkeys(paths)
+        reordered.pop(project_path, None)
+        reordered[project_path] = None
+        paths[:] = reordered
+
+        persist_history_debounced()
 
 
 NOT_SET = object()
@@ -247,7 +375,15 @@ def value_of(item):
     return item
 
 
-State: DefaultDict[sublime_plugin.Command, Dict] = defaultdict(dict)
+# Weak keys so command instances (and the continuations we park for
+# them) don't outlive their windows.
+State: "weakref.WeakKeyDictionary[sublime_plugin.Command, Dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def state_for(cmd: sublime_plugin.Command) -> Dict:
+    return State.setdefault(cmd, {})
 
 
 @dataclass(frozen=True)
@@ -268,23 +404,65 @@ def const(value):
     return lambda *args, **kwargs: value
 
 
+DESCRIPTIVE_ATTRS = (
+    "name",
+    "want_event",
+    "placeholder",
+    "initial_text",
+    "initial_selection",
+    "preview",
+    "validate",
+    "next_input",
+)
+
+
 class DescriptiveInputHandler(type):
     def __init__(cls, cls_name, bases, attrs):
-        for attr_name in (
-            "name",
-            "want_event",
-            "placeholder",
-            "initial_text",
-            "initial_selection",
-            "preview",
-            "validate",
-            "next_input",
-        ):
+        for attr_name in DESCRIPTIVE_ATTRS:
             value = attrs.get(attr_name)
             if not callable(value):
                 setattr(cls, attr_name, const(value))
 
 
+class GenericListInputHandler(
+    sublime_plugin.ListInputHandler, metaclass=DescriptiveInputHandler
+):
+    # Defined once at module scope so the metaclass does its attribute
+    # wrapping at import time, not on every panel open.  All per-call
+    # behavior comes in via `cfg`.
+    want_event = True
+
+    def __init__(self, cfg: Dict[str, Any]) -> None:
+        self._cfg = cfg
+
+    def name(self):
+        return self._cfg["name"]
+
+    def placeholder(self):
+        return self._cfg["placeholder"]
+
+    def initial_text(self):
+        return self._cfg["initial_text"]
+
+    def initial_selection(self):
+        return self._cfg["initial_selection"]
+
+    def list_items(self):
+        return self._cfg["list_items"]()
+
+    def validate(self, text, event=None):
+        return True
+
+    def confirm(self, text, event=None):
+        return self._cfg["confirm"](text, event)
+
+    def preview(self, text) -> Optional[str]:
+        return self._cfg["preview"](text)
+
+    def next_input(self, args):
+        return self._cfg["next_input"](args)
+
+
 def list_input_handler(
     name,
     cmd,
@@ -299,95 +477,85 @@ def list_input_handler(
     initial_selection=[],
     resolve_with=None,
 ):
-    _name = name
     _next_input = next_input
-    _placeholder = placeholder
-    _initial_text = initial_text
-    _initial_selection = initial_selection
     _items = NOT_SET if callable(items) else items
     _next_handler = None
 
     def kont(first_arg, rest=None):
         if first_arg is CANCEL_COMMAND:
-            State[cmd]["cancel"] = True
+            state_for(cmd)["cancel"] = True
 
         elif isinstance(first_arg, sublime_plugin.ListInputHandler):
             nonlocal _next_handler
             if rest and rest.get("push", False):
                 _next_handler = first_arg
             else:
-                State[cmd]["next_handler"] = first_arg
+                state_for(cmd)["next_handler"] = first_arg
 
         else:
             new_args = {name: first_arg, **rest}
-            State[cmd].setdefault("new_args", {}).update(new_args)
-
-    class ListInputHandler(
-        sublime_plugin.ListInputHandler, metaclass=DescriptiveInputHandler
-    ):
-        name = _name
-        want_event = True
-        placeholder = _placeholder
-        initial_text = _initial_text
-        initial_selection = _initial_selection
-
-        def list_items(self):
-            nonlocal _items
-            if _items is NOT_SET:
-                _items = items()
-            if resolve_with is not None:
-                for item in _items:
-                    if value_of(item) == resolve_with:
-                        sublime.set_timeout(lambda: run_cmd(cmd, "select"))
-                        return ([item], 0)
-            return (_items, selected_index)
-
-        def validate(self, text, event=None):
-            return True
-
-        if on_select:
-
-            def confirm(self, text, event):
-                selected_index = next(
-                    (
-                        idx
-                        for idx, item in enumerate(_items)
-                        if text == value_of(item)
-                    ),
-                    None,
-                )
-                done_called = False
-
-                def done(*args, **kwargs):
-                    nonlocal done_called
-                    done_called = True
-                    kont(*args, **kwargs)
-
-                modifiers = Modifiers.from_event(event)
-                on_select(text, modifiers, selected_index, done)
-                if not done_called:
-                    kont(CANCEL_COMMAND)
+            state_for(cmd).setdefault("new_args", {}).update(new_args)
+
+    def list_items():
+        nonlocal _items
+        if _items is NOT_SET:
+            _items = items()
+        if resolve_with is not None:
+            for item in _items:
+                if value_of(item) == resolve_with:
+                    sublime.set_timeout(lambda: run_cmd(cmd, "select"))
+                    return ([item], 0)
+        return (_items, selected_index)
+
+    if on_select:
+
+        def confirm(text, event):
+            selected_index = next(
+                (
+                    idx
+                    for idx, item in enumerate(_items)
+                    if text == value_of(item)
+                ),
+                None,
+            )
+            done_called = False
 
-        else:
+            def done(*args, **kwargs):
+                nonlocal done_called
+                done_called = True
+                kont(*args, **kwargs)
 
-            def confirm(self, text, event=None):  # type: ignore[misc]
-                pass
+            modifiers = Modifiers.from_event(event)
+            on_select(text, modifiers, selected_index, done)
+            if not done_called:
+                kont(CANCEL_COMMAND)
 
-        if on_highlight:
+    else:
+        confirm = const(None)
 
-            def preview(self, text) -> Optional[str]:
-                return on_highlight(text)
+    preview = on_highlight if on_highlight else const(None)
 
-        def next_input(self, args):
-            nonlocal _next_handler
-            next_handler, _next_handler = _next_handler, None
-            if next_handler:
-                return next_handler
+    def next_input_(args):
+        nonlocal _next_handler
+        next_handler, _next_handler = _next_handler, None
+        if next_handler:
+            return next_handler
 
-            if _next_input:
-                return _next_input(args)
+        if _next_input:
+            return _next_input(args)
 
-    return ListInputHandler()
+    return GenericListInputHandler(
+        {
+            "name": name,
+            "placeholder": placeholder,
+            "initial_text": initial_text,
+            "initial_selection": initial_selection,
+            "list_items": list_items,
+            "confirm": confirm,
+            "preview": preview,
+            "next_input": next_input_,
+        }
+    )
 
 
 class WithArgsFromInputHandler(sublime_plugin.Command):
@@ -404,10 +572,10 @@ class WithArgsFromInputHandler(sublime_plugin.Command):
         if args is None:
             args = {}
 
-        if State[self].pop("cancel", False):
+        if state_for(self).pop("cancel", False):
             return
 
-        next_handler = State[self].get("next_handler", None)
+        next_handler = state_for(self).get("next_handler", None)
         if next_handler:
             run_cmd(
                 self,
@@ -420,17 +588,21 @@ class WithArgsFromInputHandler(sublime_plugin.Command):
             )
             return
 
-        new_args = State[self].pop("new_args", {})
+        new_args = state_for(self).pop("new_args", {})
         return super().run_(edit_token, {**args, **new_args})
 
     def input_description(self) -> str:
         return self.crumb
 
     def input(self, args):
-        next_handler = State[self].pop("next_handler", None)
+        next_handler = state_for(self).pop("next_handler", None)
         if next_handler:
             return next_handler
 
+        if self.input_handlers.keys() <= args.keys():
+            # All args given, don't even compute the defaults.
+            return None
+
         for arg_name, handler in self.input_handlers.items():
             if arg_name not in args:
                 args_with_defaults = {**default_args(self.run), **args}
@@ -451,9 +623,14 @@ def run_cmd(cmd, cmd_name, args=None):
 
 def default_args(fn):
     # type: (Callable) -> Dict[str, object]
+    # Cache on the underlying function: a bound method is a fresh
+    # object per access, which would fragment the lru_cache per
+    # instance.  `self` carries no default, so the result is the same.
     return {
         name: parameter.default
-        for name, parameter in _signature(fn).parameters.items()
+        for name, parameter in _signature(
+            getattr(fn, "__func__", fn)
+        ).parameters.items()
         if parameter.default is not inspect.Parameter.empty
     }
 
@@ -470,23 +647,75 @@ PROJECT_KIND = [sublime.KIND_ID_NAMESPACE, "P", "Project"]
 EMPTY_LIST_ITEM = sublime.ListInputItem(text=EMPTY_LIST_MESSAGE, value=None)
 
 
+_EXISTS_CACHE: Dict[str, Tuple[float, bool]] = {}
+EXISTS_TTL = 5.0  # [seconds]
+
+
+def path_exists(path: str) -> bool:
+    # `os.path.exists` is a stat syscall per path; opening the panel
+    # twice in a row shouldn't stat the whole history again.
+    now = time.monotonic()
+    hit = _EXISTS_CACHE.get(path)
+    if hit and now - hit[0] < EXISTS_TTL:
+        return hit[1]
+
+    rv = os.path.exists(path)
+    _EXISTS_CACHE[path] = (now, rv)
+    return rv
+
+
+def prime_exists_cache(paths: List[str]) -> None:
+    # Many history entries live under the same parent; one listing per
+    # parent beats a stat per path there.
+    now = time.monotonic()
+    grouped: DefaultDict[str, List[str]] = defaultdict(list)
+    for p in paths:
+        hit = _EXISTS_CACHE.get(p)
+        if not (hit and now - hit[0] < EXISTS_TTL):
+            grouped[os.path.dirname(p)].append(p)
+
+    for parent, group in grouped.items():
+        if len(group) == 1:
+            p = group[0]
+            _EXISTS_CACHE[p] = (now, os.path.exists(p))
+            continue
+
+        try:
+            names = set(os.listdir(parent))
+        except OSError:
+            names = set()
+        for p in group:
+            # The listing compare is byte-exact and can miss on
+            # normalizing or case-insensitive filesystems; only trust
+            # a positive answer and re-check misses with a real stat.
+            _EXISTS_CACHE[p] = (
+                now,
+                os.path.basename(p) in names or os.path.exists(p),
+            )
+
+
 def ask_for_project_file(cmd, args, assume_closed=None, selected_index=1):
     new_window = args.get("new_window")
 
-    open_projects = [
+    open_projects = {
         project_file_name
         for w in sublime.windows()
         if (project_file_name := w.project_file_name())
         if (project_file_name != assume_closed)
-    ]
+    }
 
     def get_items():
         _paths = get_paths_history()
-        paths = [p for p in _paths if os.path.exists(p)]
+        prime_exists_cache(_paths)
+        paths = [p for p in _paths if path_exists(p)]
         if paths != _paths:
             persist_history(paths=paths)
-        paths = list(reversed(paths))
-        return format_items(paths, open_projects) if paths else [EMPTY_LIST_ITEM]
+        paths = paths[::-1]
+        return (
+            format_items(tuple(paths), frozenset(open_projects))
+            if paths
+            else [EMPTY_LIST_ITEM]
+        )
 
     def preview(text):
         if text is None:
@@ -534,57 +763,62 @@ def ask_for_project_file(cmd, args, assume_closed=None, selected_index=1):
     )
 
 
-def format_items(paths: List[str], open_projects: List[str]):
-    _paths = [
-        (p, stem, components[1:])
-        for p, components in (
-            (p, list(reversed(p.split(os.sep)))) for p in paths
-        )
-        if (stem := components[0][:-16])
-    ]
-
-    grouped_by_stem = defaultdict(list)
-    for path, stem, components in _paths:
-        grouped_by_stem[stem].append((path, components))
-    unique = lambda stem: len(grouped_by_stem[stem]) == 1  # noqa: E731
-
-    rv = []
-    for path, stem, components in _paths:
-        if unique(stem):
-            display_name = stem
-
-        else:
-            others = [
-                components_
-                for path_, components_ in grouped_by_stem[stem]
-                if path_ != path
-            ]
-            reduced_components = []
-            for part, *other_parts in zip(*(components, *others)):
-                reduced_components.append(part)
-                if any(p != part for p in other_parts):
-                    break
-
-            display_name = f" {os.sep} ".join(
-                [stem]
-                + (
-                    # Often the project file ("stem") is the same as the
-                    # folder name, omit the duplication then.
-                    reduced_components[1:]
-                    if reduced_components[0] == stem
-                    else reduced_components
-                ),
-            )
+SEP = f" {os.sep} "
+
+
+@lru_cache(maxsize=4)
+def format_items(paths: Tuple[str, ...], open_projects: FrozenSet[str]):
+    _paths = []
+    grouped_by_stem: DefaultDict[str, List[str]] = defaultdict(list)
+    for p in paths:
+        if stem := os.path.basename(p)[:-PROJECT_FILE_EXT_LEN]:
+            _paths.append((p, stem))
+            grouped_by_stem[stem].append(p)
+
+    # Typically no stems collide at all; settle that with one
+    # comparison instead of a group lookup per row.
+    all_unique = len(grouped_by_stem) == len(_paths)
+
+    # Resolve colliding groups up front so every member is split
+    # exactly once, not once per sibling.
+    display_names: Dict[str, str] = {}
+    if not all_unique:
+        for stem, group in grouped_by_stem.items():
+            if len(group) == 1:
+                continue
+
+            split_group = [(path, path.split(os.sep)[-2::-1]) for path in group]
+            for path, components in split_group:
+                others = [
+                    components_
+                    for path_, components_ in split_group
+                    if path_ != path
+                ]
+                reduced_components = []
+                for part, *other_parts in zip(*(components, *others)):
+                    reduced_components.append(part)
+                    if any(p != part for p in other_parts):
+                        break
+
+                display_names[path] = SEP.join(
+                    [stem]
+                    + (
+                        # Often the project file ("stem") is the same as
+                        # the folder name, omit the duplication then.
+                        reduced_components[1:]
+                        if reduced_components[0] == stem
+                        else reduced_components
+                    ),
+                )
 
-        rv.append(
-            sublime.ListInputItem(
-                text=display_name,
-                value=path,
-                kind=(WINDOW_KIND if path in open_projects else PROJECT_KIND),
-            )
+    return [
+        sublime.ListInputItem(
+            text=display_names.get(path, stem),
+            value=path,
+            kind=(WINDOW_KIND if path in open_projects else PROJECT_KIND),
         )
-
-    return rv
+        for path, stem in _paths
+    ]
 
 
 class open_last_used_project(